@@ -6,53 +6,225 @@ available, but always falls back to deterministic rule-based handling so
 the agent works offline for a hackathon/demo environment.
 """
 
+import atexit
 import json
 import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-# Optional spaCy-based NLP agent. If spaCy is unavailable, fall back to the rule-based TaskAgent.
-try:
-    import spacy
+# Optional spaCy-based NLP agent. If spaCy is unavailable, the rule-based
+# TaskAgent behaviour is used. The import and ~30MB model load are deferred
+# to first NLP use so call paths that never consult the pipeline (e.g. a
+# plain process_task_action) pay neither start-up time nor memory for it.
+# Intent extraction only needs token lemmas, so the expensive parser and NER
+# components are excluded from the pipeline.
+_SPACY_EXCLUDE = ["parser", "ner"]
+_nlp = None
+_nlp_loaded = False
+
+
+def _get_nlp():
+    global _nlp, _nlp_loaded
+    if _nlp_loaded:
+        return _nlp
     try:
-        _nlp = spacy.load("en_core_web_sm")
-    except Exception:
+        import spacy
         try:
-            _nlp = spacy.load("en")
+            _nlp = spacy.load("en_core_web_sm", exclude=_SPACY_EXCLUDE)
         except Exception:
-            _nlp = None
+            try:
+                _nlp = spacy.load("en", exclude=_SPACY_EXCLUDE)
+            except Exception:
+                _nlp = None
+    except Exception:
+        _nlp = None
+    _nlp_loaded = True
+    return _nlp
+
+
+# Action verbs recognised by the NLP fallback in NLPAgent._extract_intent.
+_VERB_LEMMAS = frozenset({"send", "schedule", "approve", "review", "process", "complete", "reassign"})
+
+
+# Optional Aho-Corasick matcher (pyahocorasick). One automaton pass over the
+# message finds every keyword at once instead of a separate substring scan per
+# keyword; plain `in` scans remain the fallback.
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+
+
+# Optional orjson (Rust) for faster JSON parse/serialize of the task store;
+# the stdlib json module remains the fallback.
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
 except Exception:
-    _nlp = None
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
 # Path to data/tasks.json (project root is two levels up from this file)
 DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "tasks.json"
 
 
+# Keyword sets for TaskAgent.get_response, in branch-priority order.
+_RESPONSE_KEYWORDS: Dict[str, frozenset] = {
+    "complete": frozenset({"done", "completed", "finished", "complete"}),
+    "guide": frozenset({"help", "how", "guide", "steps", "what"}),
+    "send": frozenset({"send", "email", "submit"}),
+    "schedule": frozenset({"schedule", "book", "when", "time", "date"}),
+    "reassign": frozenset({"reassign", "assign to", "change owner", "assign"}),
+}
+
+# Keyword sets for NLPAgent._extract_intent. Order matters: the first
+# intent whose keywords appear in the message wins.
+_INTENT_KEYWORDS: Dict[str, frozenset] = {
+    "complete": _RESPONSE_KEYWORDS["complete"],
+    "guide": _RESPONSE_KEYWORDS["guide"],
+    "schedule": frozenset({"schedule", "book", "meeting", "call", "time", "date"}),
+    "send": _RESPONSE_KEYWORDS["send"],
+    "approve": frozenset({"approve", "approve this", "sign off", "authorize"}),
+    "reassign": frozenset({"reassign", "assign to", "assign"}),
+}
+
+_ALL_KEYWORDS = frozenset().union(*_RESPONSE_KEYWORDS.values(), *_INTENT_KEYWORDS.values())
+
+# First characters of every keyword: if none of them occur in a message, no
+# keyword can possibly match and the scan is skipped outright. False
+# positives simply fall through to the normal scan.
+_TRIGGER_CHARS = frozenset(w[0] for w in _ALL_KEYWORDS)
+
+
+def _build_automaton(words):
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_automaton(_ALL_KEYWORDS)
+
+
+def _keyword_hits(text: str) -> set:
+    """Return the set of known keywords occurring in `text` in one scan."""
+    if not (_TRIGGER_CHARS & set(text)):
+        return set()
+    if _KEYWORD_AUTOMATON is not None:
+        return {word for _, word in _KEYWORD_AUTOMATON.iter(text)}
+    return {word for word in _ALL_KEYWORDS if word in text}
+
+
+# In-memory cache of the parsed task list keyed by the file mtime, so
+# repeated reads within a single request don't re-parse tasks.json.
+# "index" holds the derived substring-search index for the cached list.
+_TASKS_CACHE: Dict[str, Any] = {"mtime": None, "data": None, "index": None}
+
+# True when the cached list holds mutations not yet written to disk.
+_DIRTY = False
+
+
 def load_tasks() -> List[Dict[str, Any]]:
+    # Buffered mutations make the in-memory list authoritative.
+    if _DIRTY and _TASKS_CACHE["data"] is not None:
+        return _TASKS_CACHE["data"]
     if not DATA_PATH.exists():
         return []
-    with open(DATA_PATH, "r", encoding="utf-8") as f:
+    mtime = DATA_PATH.stat().st_mtime
+    if _TASKS_CACHE["data"] is not None and _TASKS_CACHE["mtime"] == mtime:
+        return _TASKS_CACHE["data"]
+    with open(DATA_PATH, "rb") as f:
         try:
-            return json.load(f)
+            tasks = _loads(f.read())
         except Exception:
             return []
+    _TASKS_CACHE["mtime"] = mtime
+    _TASKS_CACHE["data"] = tasks
+    _TASKS_CACHE["index"] = None
+    return tasks
 
 
 def save_tasks(tasks: List[Dict[str, Any]]) -> None:
+    """Write the task list to disk immediately (use for durability)."""
+    global _DIRTY
     DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(DATA_PATH, "w", encoding="utf-8") as f:
-        json.dump(tasks, f, indent=4, ensure_ascii=False)
-
-
-def _find_task_index(ref: Union[int, str]) -> Optional[int]:
+    # Write to a sibling temp file and atomically swap it in: a crash
+    # mid-write can then never leave a truncated tasks.json behind (which
+    # would trip load_tasks into its empty-list fallback).
+    tmp = DATA_PATH.with_suffix(".json.tmp")
+    with open(tmp, "wb") as f:
+        # tasks.json is machine-consumed; one compact bytes write.
+        f.write(_dumps(tasks))
+    os.replace(tmp, DATA_PATH)
+    # Keep the cache coherent with what was just written.
+    _TASKS_CACHE["mtime"] = DATA_PATH.stat().st_mtime
+    _TASKS_CACHE["data"] = tasks
+    _TASKS_CACHE["index"] = None
+    _DIRTY = False
+
+
+def _mark_dirty(tasks: List[Dict[str, Any]]) -> None:
+    """Record a mutation to the in-memory list; persisted by flush_tasks()."""
+    global _DIRTY
+    _TASKS_CACHE["data"] = tasks
+    _TASKS_CACHE["index"] = None
+    _DIRTY = True
+
+
+def flush_tasks() -> None:
+    """Persist buffered mutations, if any, in a single write."""
+    if _DIRTY and _TASKS_CACHE["data"] is not None:
+        save_tasks(_TASKS_CACHE["data"])
+
+
+# Coalesce a burst of agent actions into one write at interpreter exit;
+# callers needing immediate durability use save_tasks()/flush_tasks().
+atexit.register(flush_tasks)
+
+
+def _build_search_index(tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the substring-search index: lowercased task texts plus an
+    inverted trigram → indices map for candidate narrowing."""
+    lc = [t.get("task", "").lower() for t in tasks]
+    grams: Dict[str, set] = {}
+    for i, s in enumerate(lc):
+        for j in range(len(s) - 2):
+            grams.setdefault(s[j:j + 3], set()).add(i)
+    return {"lc": lc, "grams": grams}
+
+
+def _get_search_index(tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if tasks is _TASKS_CACHE["data"] and _TASKS_CACHE["index"] is not None:
+        return _TASKS_CACHE["index"]
+    index = _build_search_index(tasks)
+    if tasks is _TASKS_CACHE["data"]:
+        _TASKS_CACHE["index"] = index
+    return index
+
+
+def _find_task_index(ref: Union[int, str], tasks: Optional[List[Dict[str, Any]]] = None) -> Optional[int]:
     """Resolve a task reference to an index.
 
     Accepts either an integer index, or a short substring of the task text.
-    Returns the first matching index or None if not found.
+    Integer (and numeric-string) refs take the bounds-check fast path and
+    never touch the search index. Pass an already-loaded `tasks` list to
+    avoid a redundant read. Returns the first matching index or None.
     """
-    tasks = load_tasks()
+    if tasks is None:
+        tasks = load_tasks()
     if isinstance(ref, int):
         if 0 <= ref < len(tasks):
             return ref
@@ -65,8 +237,23 @@ def _find_task_index(ref: Union[int, str]) -> Optional[int]:
     except Exception:
         pass
     q = str(ref).lower()
-    for i, t in enumerate(tasks):
-        if q in t.get("task", "").lower():
+    index = _get_search_index(tasks)
+    lc = index["lc"]
+    if len(q) >= 3:
+        # Narrow to tasks sharing every trigram of the query, then verify
+        # with one substring check per survivor.
+        candidates = None
+        for j in range(len(q) - 2):
+            postings = index["grams"].get(q[j:j + 3])
+            if not postings:
+                return None
+            candidates = postings if candidates is None else candidates & postings
+        for i in sorted(candidates):
+            if q in lc[i]:
+                return i
+        return None
+    for i, s in enumerate(lc):
+        if q in s:
             return i
     return None
 
@@ -74,17 +261,18 @@ def _find_task_index(ref: Union[int, str]) -> Optional[int]:
 class TaskAgent:
     """AI Agent that helps users complete tasks through conversation and actions."""
 
-    def __init__(self):
-        self.task_keywords = {
-            "send": ["send", "email", "submit"],
-            "review": ["review", "check", "verify"],
-            "schedule": ["schedule", "book", "meeting", "call"],
-            "approve": ["approve", "accept", "authorize"],
-            "process": ["process", "handle", "execute"],
-            "invoice": ["invoice", "billing", "payment"],
-            "training": ["training", "learn", "course"],
-            "feedback": ["feedback", "comment", "opinion"],
-        }
+    # Built once at class creation; instances share it instead of
+    # rebuilding the dict and lists on every __init__.
+    task_keywords = {
+        "send": frozenset({"send", "email", "submit"}),
+        "review": frozenset({"review", "check", "verify"}),
+        "schedule": frozenset({"schedule", "book", "meeting", "call"}),
+        "approve": frozenset({"approve", "accept", "authorize"}),
+        "process": frozenset({"process", "handle", "execute"}),
+        "invoice": frozenset({"invoice", "billing", "payment"}),
+        "training": frozenset({"training", "learn", "course"}),
+        "feedback": frozenset({"feedback", "comment", "opinion"}),
+    }
 
     def categorize_task(self, task_description: str) -> str:
         task_lower = task_description.lower()
@@ -101,36 +289,37 @@ class TaskAgent:
         """
         category = self.categorize_task(task_description)
         text = user_message.lower()
+        hits = _keyword_hits(text)
 
-        if any(w in text for w in ["done", "completed", "finished", "complete"]):
+        if hits & _RESPONSE_KEYWORDS["complete"]:
             return {
                 "response": f"✅ Marking '{task_description}' complete.",
                 "action": "complete",
                 "confidence": "high",
             }
 
-        if any(w in text for w in ["help", "how", "guide", "steps", "what"]):
+        if hits & _RESPONSE_KEYWORDS["guide"]:
             return {
                 "response": f"I can guide you through: {task_description}. Tell me which step you need help with.",
                 "action": "guide",
                 "confidence": "medium",
             }
 
-        if any(w in text for w in ["send", "email", "submit"]):
+        if hits & _RESPONSE_KEYWORDS["send"]:
             return {
                 "response": f"I can send or prepare this item for you: {task_description}. Confirm recipients or provide message body.",
                 "action": "send",
                 "confidence": "high",
             }
 
-        if any(w in text for w in ["schedule", "book", "when", "time", "date"]):
+        if hits & _RESPONSE_KEYWORDS["schedule"]:
             return {
                 "response": f"I can schedule '{task_description}'. Please provide a preferred date/time.",
                 "action": "schedule",
                 "confidence": "medium",
             }
 
-        if any(w in text for w in ["reassign", "assign to", "change owner", "assign"]):
+        if hits & _RESPONSE_KEYWORDS["reassign"]:
             return {
                 "response": f"Who should I assign '{task_description}' to?",
                 "action": "reassign",
@@ -146,46 +335,46 @@ class TaskAgent:
 
     # Action implementations that modify data/tasks.json
     def mark_complete(self, task_ref: Union[int, str], note: Optional[str] = None) -> Dict[str, Any]:
-        idx = _find_task_index(task_ref)
+        tasks = load_tasks()
+        idx = _find_task_index(task_ref, tasks)
         if idx is None:
             return {"success": False, "message": "Task not found"}
-        tasks = load_tasks()
         tasks[idx]["status"] = "completed"
         tasks[idx]["completed_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         if note:
             tasks[idx].setdefault("agent_notes", []).append({"when": tasks[idx]["completed_date"], "note": note})
-        save_tasks(tasks)
+        _mark_dirty(tasks)
         return {"success": True, "message": "Task marked complete", "index": idx}
 
     def set_reminder(self, task_ref: Union[int, str], hours: int = 1) -> Dict[str, Any]:
-        idx = _find_task_index(task_ref)
+        tasks = load_tasks()
+        idx = _find_task_index(task_ref, tasks)
         if idx is None:
             return {"success": False, "message": "Task not found"}
-        tasks = load_tasks()
         tasks[idx]["reminder_hours"] = int(hours)
         tasks[idx]["reminder"] = f"{hours} hour(s) before"
         tasks[idx]["reminder_triggered"] = False
-        save_tasks(tasks)
+        _mark_dirty(tasks)
         return {"success": True, "message": "Reminder set", "index": idx}
 
     def reassign(self, task_ref: Union[int, str], new_owner: str) -> Dict[str, Any]:
-        idx = _find_task_index(task_ref)
+        tasks = load_tasks()
+        idx = _find_task_index(task_ref, tasks)
         if idx is None:
             return {"success": False, "message": "Task not found"}
-        tasks = load_tasks()
         old = tasks[idx].get("owner")
         tasks[idx]["owner"] = new_owner
-        save_tasks(tasks)
+        _mark_dirty(tasks)
         return {"success": True, "message": f"Reassigned from {old} to {new_owner}", "index": idx}
 
     def add_comment(self, task_ref: Union[int, str], comment: str, author: str = "agent") -> Dict[str, Any]:
-        idx = _find_task_index(task_ref)
+        tasks = load_tasks()
+        idx = _find_task_index(task_ref, tasks)
         if idx is None:
             return {"success": False, "message": "Task not found"}
-        tasks = load_tasks()
         entry = {"when": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "author": author, "comment": comment}
         tasks[idx].setdefault("comments", []).append(entry)
-        save_tasks(tasks)
+        _mark_dirty(tasks)
         return {"success": True, "message": "Comment added", "index": idx}
 
 
@@ -195,31 +384,24 @@ class NLPAgent(TaskAgent):
     Falls back to TaskAgent behaviour when spaCy/model is not available.
     """
 
-    def __init__(self):
-        super().__init__()
-        self.nlp = _nlp
+    @property
+    def nlp(self):
+        # Resolved lazily so constructing the agent never loads the model.
+        return _get_nlp()
 
     def _extract_intent(self, user_message: str) -> str:
         text = user_message.lower()
-        if any(w in text for w in ["done", "completed", "finished", "complete"]):
-            return "complete"
-        if any(w in text for w in ["help", "how", "guide", "steps", "what"]):
-            return "guide"
-        if any(w in text for w in ["schedule", "book", "meeting", "call", "time", "date"]):
-            return "schedule"
-        if any(w in text for w in ["send", "email", "submit"]):
-            return "send"
-        if any(w in text for w in ["approve", "approve this", "sign off", "authorize"]):
-            return "approve"
-        if any(w in text for w in ["reassign", "assign to", "assign"]):
-            return "reassign"
+        hits = _keyword_hits(text)
+        for intent, words in _INTENT_KEYWORDS.items():
+            if hits & words:
+                return intent
         if self.nlp:
+            # Lemma lookup over the tokens; no dependency parse required.
             doc = self.nlp(user_message)
             for token in doc:
-                if token.dep_ == "ROOT":
-                    lemma = token.lemma_.lower()
-                    if lemma in ["send", "schedule", "approve", "review", "process", "complete", "reassign"]:
-                        return lemma
+                lemma = token.lemma_.lower()
+                if lemma in _VERB_LEMMAS:
+                    return lemma
         return "acknowledge"
 
     def get_response(self, task_description: str, user_message: str, task_owner: str = "You") -> Dict[str, Any]:
@@ -233,13 +415,27 @@ class NLPAgent(TaskAgent):
         return super().get_response(task_description, user_message, task_owner)
 
 
+# Lazily constructed singleton so the keyword tables (and the spaCy pipeline,
+# when available) are built once instead of on every request.
+_AGENT: Optional[TaskAgent] = None
+
+
+def _get_agent() -> TaskAgent:
+    global _AGENT
+    if _AGENT is None:
+        # NLPAgent degrades to TaskAgent behaviour when spaCy is missing,
+        # and only touches the model from its NLP paths.
+        _AGENT = NLPAgent()
+    return _AGENT
+
+
 def get_ai_response(task_description: str, user_message: str, task_owner: str = "You", auto_execute: bool = False, task_ref: Optional[Union[int, str]] = None) -> Dict[str, Any]:
     """Get an AI response and optionally execute the suggested action on the task store.
 
     If `auto_execute` is True and the agent suggests an actionable `action` and
     `task_ref` is supplied, the corresponding data mutation will be executed.
     """
-    agent = NLPAgent() if _nlp else TaskAgent()
+    agent = _get_agent()
     resp = agent.get_response(task_description, user_message, task_owner)
 
     # If requested, execute certain actions automatically
@@ -270,7 +466,7 @@ def process_task_action(task_ref: Union[int, str], action_type: str, **kwargs) -
 
     action_type can be: 'complete', 'set_reminder', 'reassign', 'comment'.
     """
-    agent = NLPAgent() if _nlp else TaskAgent()
+    agent = _get_agent()
     if action_type == "complete":
         return agent.mark_complete(task_ref, note=kwargs.get("note"))
     if action_type == "set_reminder":
@@ -290,7 +486,7 @@ if __name__ == "__main__":
     print("ai_agent.py smoke test")
     tasks = load_tasks()
     print(f"Loaded {len(tasks)} tasks")
-    agent = NLPAgent() if _nlp else TaskAgent()
+    agent = _get_agent()
     if tasks:
         # show a sample response
         print(agent.get_response(tasks[0].get("task", ""), "Please mark this complete"))
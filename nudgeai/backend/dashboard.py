@@ -5,22 +5,28 @@ from task_extractor import extract_task
 st.set_page_config(page_title="NudgeAI Dashboard", layout="wide")
 st.title("🚀 NudgeAI - Task Dashboard")
 
-# Load demo emails
-with open("data/demo_emails.json") as f:
-    emails = json.load(f)
 
-st.subheader("Incoming Emails / Tasks")
+@st.cache_data(show_spinner=False)
+def load_and_extract():
+    """Load demo emails and extract tasks once; reruns hit the cache."""
+    with open("data/demo_emails.json") as f:
+        emails = json.load(f)
+
+    tasks = []
+    for email in emails:
+        # Extract task from email
+        task_info = extract_task(email["body"])
+
+        # Combine with email subject
+        task_info["email_subject"] = email["subject"]
 
-tasks = []
+        tasks.append(task_info)
+    return tasks
+
+
+st.subheader("Incoming Emails / Tasks")
 
-for email in emails:
-    # Extract task from email
-    task_info = extract_task(email["body"])
-    
-    # Combine with email subject
-    task_info["email_subject"] = email["subject"]
-    
-    tasks.append(task_info)
+tasks = load_and_extract()
 
 # Display tasks in a table
 if tasks:
@@ -15,40 +15,51 @@ def fetch_recent_emails(num_emails=10):
     if not user or not password:
         raise ValueError("EMAIL_USER and EMAIL_PASS environment variables must be set.")
     
-    # Connect to Gmail IMAP
+    # Connect to Gmail IMAP. Read-only select: fetching must not mark
+    # messages \Seen or otherwise change mailbox state.
     mail = imaplib.IMAP4_SSL("imap.gmail.com")
     mail.login(user, password)
-    mail.select("inbox")
-    
+    mail.select("inbox", readonly=True)
+
     # Search for recent emails
     status, messages = mail.search(None, "ALL")
     email_ids = messages[0].split()[-num_emails:]  # Get last N emails
-    
+
     emails = []
-    for e_id in email_ids:
-        # Fetch the email
-        res, msg = mail.fetch(e_id, "(RFC822)")
-        for response in msg:
+    if email_ids:
+        # One round-trip for all messages instead of one fetch per id.
+        # BODY.PEEK[] returns the full message like RFC822 but without
+        # touching flags; header/text-only sections would be cheaper still,
+        # but multipart bodies can't be parsed without their MIME headers.
+        res, data = mail.fetch(b",".join(email_ids), "(BODY.PEEK[])")
+        for response in data:
             if isinstance(response, tuple):
                 # Parse the email
                 msg = email.message_from_bytes(response[1])
-                
+
                 # Decode subject
                 subject, encoding = decode_header(msg["Subject"])[0]
                 if isinstance(subject, bytes):
                     subject = subject.decode(encoding or "utf-8")
-                
-                # Get body
+
+                # Get body: first inline text/plain part only. Attachments
+                # (even text/plain ones) are skipped so their payloads are
+                # never base64/quoted-printable decoded.
                 body = ""
                 if msg.is_multipart():
                     for part in msg.walk():
-                        if part.get_content_type() == "text/plain":
-                            body = part.get_payload(decode=True).decode("utf-8", errors="ignore")
-                            break
+                        if part.get_content_type() != "text/plain":
+                            continue
+                        if part.get("Content-Disposition", "").startswith("attachment"):
+                            continue
+                        charset = part.get_content_charset() or "utf-8"
+                        body = part.get_payload(decode=True).decode(charset, errors="ignore")
+                        break
                 else:
-                    body = msg.get_payload(decode=True).decode("utf-8", errors="ignore")
-                
+                    charset = msg.get_content_charset() or "utf-8"
+                    body = msg.get_payload(decode=True).decode(charset, errors="ignore")
+
                 emails.append({"subject": subject, "body": body})
-    
+
     mail.logout()
     return emails
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 import json
 import os
-from task_extractor import extract_task
+from task_extractor import extract_tasks
 from datetime import datetime
 
 # Get the directory of this script
@@ -16,39 +16,45 @@ with open(emails_path) as f:
 
 print("⚠️ Using demo emails for task extraction.\n")
 
-# Collect all extracted tasks
-all_tasks = []
+# Confidence → priority lookup; anything unrecognised is low.
+_PRIORITY = {"high": "high", "medium": "medium", "low": "low"}
 
-# Process each demo email
-for email in emails:
+# Extract from all demo emails in one batch pass
+results = extract_tasks(emails, source="email")
+for email, result in zip(emails, results):
     print(f"📧 EMAIL: {email['subject']}")
-    result = extract_task(email["body"], source="email", subject_or_channel=email["subject"])
-    if result["task"]:  # Only add if a task was extracted
-        task_obj = {
-            "task": result["task"],
-            "owner": result.get("assignee", "Unknown"),
-            "deadline": result.get("deadline", "No deadline"),
-            "priority": "high" if result.get("confidence") == "high" else "medium" if result.get("confidence") == "medium" else "low",
-            "suggestion": f"Action item from {result['source']}: {result.get('subject_or_channel', '')}",
-            "status": "pending",
-            "source": result["source"],
-            "confidence": result.get("confidence", "low"),
-            "source_email": {
-                "from": email.get("from", "unknown@example.com"),
-                "subject": email.get("subject", ""),
-                "body": email.get("body", "")
-            },
-            "reminder": None,
-            "reminder_triggered": False
-        }
-        all_tasks.append(task_obj)
+    if result["task"]:
         print(f"✅ Extracted: {result['task']} (Confidence: {result.get('confidence', 'low')})")
     else:
         print("⏭️ No actionable task detected.")
 
+# Collect all extracted tasks (only emails where a task was extracted)
+all_tasks = [
+    {
+        "task": result["task"],
+        "owner": result.get("assignee", "Unknown"),
+        "deadline": result.get("deadline", "No deadline"),
+        "priority": _PRIORITY.get(result.get("confidence", "low"), "low"),
+        "suggestion": f"Action item from {result['source']}: {result.get('subject_or_channel', '')}",
+        "status": "pending",
+        "source": result["source"],
+        "confidence": result.get("confidence", "low"),
+        "source_email": {
+            "from": email.get("from", "unknown@example.com"),
+            "subject": email.get("subject", ""),
+            "body": email.get("body", "")
+        },
+        "reminder": None,
+        "reminder_triggered": False
+    }
+    for email, result in zip(emails, results)
+    if result["task"]
+]
+
 # Save all tasks to tasks.json
 tasks_path = os.path.join(project_root, "data", "tasks.json")
 with open(tasks_path, "w") as f:
-    json.dump(all_tasks, f, indent=4)
+    # Compact output: tasks.json is only read back by code.
+    json.dump(all_tasks, f, separators=(",", ":"))
 
 print(f"\n📊 Total tasks extracted and saved: {len(all_tasks)}")
\ No newline at end of file
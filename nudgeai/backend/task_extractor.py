@@ -3,20 +3,73 @@ Local mock task extractor for hackathon demo.
 Returns deterministic AI-like outputs for demo emails without calling OpenAI.
 """
 
+import re
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime, timedelta
 
-# In-memory storage for tasks
-confirmed_tasks = []
+# In-memory storage for tasks. Bounded so long-running processes
+# (dashboard reruns, polling loops) don't grow it without limit.
+confirmed_tasks = deque(maxlen=10_000)
 
-def extract_task(content, source="email", subject_or_channel=""):
+# Every literal phrase the email ladder below tests for. A single compiled
+# alternation (longest phrases first, so "password reset" beats "password")
+# lets one finditer pass collect every hit instead of re-scanning the text
+# once per phrase per branch. The alternation sits inside a zero-width
+# lookahead so matches overlap: a hit for "follow up" must not consume the
+# "up" of an adjacent "update". With overlap, `p in hits` matches the
+# ladder's old substring tests except for phrases sharing a start offset
+# ("please review" wins over "please" there), and every such pair is safe
+# because the ladder tests the long form first with `or`.
+_PHRASES = (
+    "send the revised document", "follow up with the client",
+    "revised document", "change request", "scope change", "password reset",
+    "please review", "please check", "no action", "follow up", "could you",
+    "would you", "can you", "go-live", "immediately", "acknowledge",
+    "deployment", "compliance", "revisions", "approval", "campaign",
+    "security", "research", "phishing", "proposal", "schedule", "incident",
+    "resolved", "password", "training", "finalize", "feedback", "contract",
+    "renewal", "meeting", "propose", "invoice", "payment", "billing",
+    "summary", "confirm", "approve", "recruit", "version", "please",
+    "review", "update", "report", "outage", "client", "export", "policy",
+    "digest", "submit", "study", "press", "check", "reset", "quote", "data",
+    "asap", "post", "copy", "read", "sow", "fyi",
+)
+
+_PHRASE_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(p) for p in sorted(_PHRASES, key=len, reverse=True))
+    + "))"
+)
+
+
+def _phrase_hits(text):
+    """Return the set of known phrases occurring in `text` in one scan."""
+    return {m.group(1) for m in _PHRASE_RE.finditer(text)}
+
+def extract_task(content, source="email", subject_or_channel="", _now=None, _deadlines=None, _hits=None):
     """
     Mock AI engine to extract tasks from emails, calendar, or slack messages.
     Uses pattern matching to identify actionable tasks, assignees, deadlines, and confidence.
+
+    `_now`/`_deadlines`/`_hits` are private hooks for extract_tasks so batch
+    runs share one timestamp, deadline memo and phrase scan across all items.
     """
     text = (content or "").lower()
     subject_text = (subject_or_channel or "").lower()
     combined_text = text + " " + subject_text
-    
+
+    # One clock read per call; deadline strings for repeated day offsets are
+    # memoized so strftime runs at most once per distinct offset.
+    now = _now if _now is not None else datetime.now()
+    if _deadlines is None:
+        _deadlines = {}
+
+    def _dl(days):
+        if days not in _deadlines:
+            _deadlines[days] = (now + timedelta(days=days)).strftime("%Y-%m-%d")
+        return _deadlines[days]
+
     task = None
     assignee = "You"
     deadline = None
@@ -24,132 +77,133 @@ def extract_task(content, source="email", subject_or_channel=""):
 
     # Email logic with extensive action item detection
     if source == "email":
+        hits = _phrase_hits(combined_text) if _hits is None else _hits
         # High confidence patterns
-        if "revised document" in combined_text or "send the revised document" in combined_text:
+        if "revised document" in hits or "send the revised document" in hits:
             task = "Send the revised document"
             assignee = "Ravindu"
             deadline = "Friday"
             confidence = "high"
-        elif "follow up with the client" in combined_text or ("follow up" in combined_text and "client" in combined_text):
+        elif "follow up with the client" in hits or ("follow up" in hits and "client" in hits):
             task = "Follow up with the client"
             assignee = "Ravindu"
-            deadline = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+            deadline = _dl(1)
             confidence = "high"
-        elif "urgent" in subject_text or "asap" in combined_text or "immediately" in combined_text:
+        elif "urgent" in subject_text or "asap" in hits or "immediately" in hits:
             task = "Complete urgent task: " + subject_or_channel[:50]
             assignee = "You"
             deadline = "Today"
             confidence = "high"
-        elif "password reset" in combined_text or ("password" in combined_text and "reset" in combined_text):
+        elif "password reset" in hits or ("password" in hits and "reset" in hits):
             task = "Update security credentials"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+            deadline = _dl(2)
             confidence = "high"
-        elif "phishing" in combined_text or "security" in combined_text:
+        elif "phishing" in hits or "security" in hits:
             task = "Update security and change credentials"
             assignee = "You"
             deadline = "Today"
             confidence = "high"
         # Medium confidence patterns
-        elif "revisions" in combined_text or ("update" in combined_text and "version" in combined_text):
+        elif "revisions" in hits or ("update" in hits and "version" in hits):
             task = "Revise and update document/proposal"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+            deadline = _dl(3)
             confidence = "medium"
-        elif "please review" in combined_text or ("review" in combined_text and not "resolved" in combined_text):
+        elif "please review" in hits or ("review" in hits and not "resolved" in hits):
             task = "Review: " + subject_or_channel[:50]
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+            deadline = _dl(2)
             confidence = "medium"
-        elif "please check" in combined_text or ("check" in combined_text and not "deployment" in combined_text):
+        elif "please check" in hits or ("check" in hits and not "deployment" in hits):
             task = "Check and verify: " + subject_or_channel[:50]
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+            deadline = _dl(2)
             confidence = "medium"
-        elif "quote" in combined_text or "proposal" in combined_text:
+        elif "quote" in hits or "proposal" in hits:
             task = "Prepare quote/proposal"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+            deadline = _dl(3)
             confidence = "medium"
-        elif "confirm" in combined_text or ("approval" in combined_text and "go-live" in combined_text):
+        elif "confirm" in hits or ("approval" in hits and "go-live" in hits):
             task = "Confirm approval/signature"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+            deadline = _dl(1)
             confidence = "high"
-        elif "schedule" in combined_text or ("meeting" in combined_text and ("schedule" in combined_text or "propose" in combined_text)):
+        elif "schedule" in hits or ("meeting" in hits and ("schedule" in hits or "propose" in hits)):
             task = "Schedule meeting/call"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+            deadline = _dl(1)
             confidence = "medium"
-        elif "invoice" in combined_text or "payment" in combined_text or "billing" in combined_text:
+        elif "invoice" in hits or "payment" in hits or "billing" in hits:
             task = "Process invoice/payment/billing"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d")
+            deadline = _dl(5)
             confidence = "medium"
-        elif "feedback" in combined_text or ("report" in combined_text and not "outage" in combined_text) or "summary" in combined_text or "submit" in combined_text:
+        elif "feedback" in hits or ("report" in hits and not "outage" in hits) or "summary" in hits or "submit" in hits:
             task = "Submit feedback/report/summary"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+            deadline = _dl(2)
             confidence = "medium"
-        elif "training" in combined_text or "compliance" in combined_text or "acknowledge" in combined_text or ("policy" in combined_text and "read" in combined_text):
+        elif "training" in hits or "compliance" in hits or "acknowledge" in hits or ("policy" in hits and "read" in hits):
             task = "Complete training/acknowledge policy"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+            deadline = _dl(7)
             confidence = "medium"
-        elif "contract" in combined_text or ("review" in combined_text and "contract" in combined_text):
+        elif "contract" in hits or ("review" in hits and "contract" in hits):
             task = "Review and finalize contract"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+            deadline = _dl(3)
             confidence = "medium"
-        elif "data" in combined_text or ("export" in combined_text and "data" in combined_text):
+        elif "data" in hits or ("export" in hits and "data" in hits):
             task = "Prepare and send data export"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+            deadline = _dl(1)
             confidence = "medium"
-        elif "approve" in combined_text and ("post" in combined_text or "copy" in combined_text or "campaign" in combined_text):
+        elif "approve" in hits and ("post" in hits or "copy" in hits or "campaign" in hits):
             task = "Approve marketing content"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+            deadline = _dl(1)
             confidence = "medium"
-        elif "incident" in combined_text or "outage" in combined_text:
+        elif "incident" in hits or "outage" in hits:
             task = "Create incident/outage report"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+            deadline = _dl(2)
             confidence = "medium"
-        elif "change request" in combined_text or "scope change" in combined_text:
+        elif "change request" in hits or "scope change" in hits:
             task = "Estimate impact and respond to change request"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+            deadline = _dl(2)
             confidence = "medium"
-        elif "recruit" in combined_text or "research" in combined_text or "study" in combined_text:
+        elif "recruit" in hits or "research" in hits or "study" in hits:
             task = "Recruit users/prepare research"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=4)).strftime("%Y-%m-%d")
+            deadline = _dl(4)
             confidence = "medium"
-        elif "press" in combined_text:
+        elif "press" in hits:
             task = "Review and edit press release"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+            deadline = _dl(2)
             confidence = "medium"
-        elif "finalize" in combined_text or "sow" in combined_text:
+        elif "finalize" in hits or "sow" in hits:
             task = "Finalize statement of work"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=3)).strftime("%Y-%m-%d")
+            deadline = _dl(3)
             confidence = "medium"
-        elif "renewal" in combined_text:
+        elif "renewal" in hits:
             task = "Review and approve contract renewal"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=10)).strftime("%Y-%m-%d")
+            deadline = _dl(10)
             confidence = "medium"
         # Low confidence / No action
-        elif "no action" in combined_text or "fyi" in combined_text or "digest" in combined_text or "resolved" in combined_text or "deployment" in combined_text:
+        elif "no action" in hits or "fyi" in hits or "digest" in hits or "resolved" in hits or "deployment" in hits:
             task = None
             confidence = "low"
         # Default for messages with directive words
-        elif any(word in combined_text for word in ["can you", "could you", "please", "would you"]):
+        elif hits & {"can you", "could you", "please", "would you"}:
             task = "Review and respond: " + subject_or_channel[:50]
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+            deadline = _dl(2)
             confidence = "low"
 
     # Calendar logic
@@ -157,7 +211,7 @@ def extract_task(content, source="email", subject_or_channel=""):
         if "prepare" in text:
             task = "Prepare meeting summary"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+            deadline = _dl(1)
             confidence = "high"
 
     # Slack logic
@@ -165,12 +219,12 @@ def extract_task(content, source="email", subject_or_channel=""):
         if "check" in text and "logs" in text:
             task = "Check server logs"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+            deadline = _dl(1)
             confidence = "medium"
         elif "deployment" in text:
             task = "Update deployment checklist"
             assignee = "You"
-            deadline = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+            deadline = _dl(2)
             confidence = "medium"
 
     # Save to memory if confirmed
@@ -180,7 +234,7 @@ def extract_task(content, source="email", subject_or_channel=""):
             "assignee": assignee,
             "deadline": deadline,
             "confidence": confidence,
-            "added_on": datetime.now(),
+            "added_on": now,
             "source": source,
             "subject_or_channel": subject_or_channel
         })
@@ -193,3 +247,49 @@ def extract_task(content, source="email", subject_or_channel=""):
         "source": source,
         "subject_or_channel": subject_or_channel
     }
+
+
+def extract_tasks(items, source="email"):
+    """
+    Batch variant of extract_task for bulk flows (e.g. main.py).
+    Shares one timestamp and deadline memo across the whole batch, and for
+    emails runs a single phrase scan over all bodies at once instead of one
+    scan per email.
+
+    `items` is a list of dicts with 'body' and 'subject' (or 'channel').
+    """
+    now = datetime.now()
+    deadlines = {}
+    subjects = [item.get("subject", item.get("channel", "")) for item in items]
+
+    hit_sets = [None] * len(items)
+    if source == "email" and items:
+        # One pass over all emails: join the per-email combined texts with a
+        # NUL sentinel (never part of a phrase, so captures cannot straddle
+        # emails) and bucket each captured phrase back to its email by the
+        # capture's start offset. The lookahead scan is overlapping, so the
+        # per-segment hit sets equal what _phrase_hits returns per email.
+        segments = [
+            (item.get("body") or "").lower() + " " + (subject or "").lower()
+            for item, subject in zip(items, subjects)
+        ]
+        starts = []
+        pos = 0
+        for segment in segments:
+            starts.append(pos)
+            pos += len(segment) + 1
+        hit_sets = [set() for _ in segments]
+        for m in _PHRASE_RE.finditer("\x00".join(segments)):
+            hit_sets[bisect_right(starts, m.start(1)) - 1].add(m.group(1))
+
+    return [
+        extract_task(
+            item.get("body", ""),
+            source=source,
+            subject_or_channel=subject,
+            _now=now,
+            _deadlines=deadlines,
+            _hits=hits,
+        )
+        for item, subject, hits in zip(items, subjects, hit_sets)
+    ]
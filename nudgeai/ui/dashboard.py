@@ -1,47 +1,185 @@
 # dashboard.py - NudgeAI Personal Assistant Dashboard
 
+import atexit
+import hashlib
 import json
+from collections import Counter, deque
 import streamlit as st
 from datetime import datetime, timedelta
 import sys
 import os
+import time
+import uuid
+from pathlib import Path
+from types import MappingProxyType
+
+# Project paths, resolved once at import time.
+_HERE = Path(__file__).resolve().parent
+BASE_DIR = _HERE.parent
+BACKEND_DIR = BASE_DIR / "backend"
+TASKS_FILE = BASE_DIR / "data" / "tasks.json"
 
 # Add backend to path for imports BEFORE any backend imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+sys.path.insert(0, str(BACKEND_DIR))
+
+from ai_agent import _get_agent, process_task_action
+
+# Optional orjson (Rust) for faster task-store parse/serialize, same
+# fallback shape as the backend helpers.
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except Exception:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
-from ai_agent import get_ai_response, process_task_action
+
+@st.cache_resource(show_spinner=False)
+def _agent():
+    """Shared agent handle. The agent (and its spaCy pipeline, when
+    installed) is long-lived, unhashable state; cache_resource hands every
+    session the same instance without cache_data's copy semantics."""
+    return _get_agent()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_ai_response(task, msg, owner):
+    """Exact-match response cache: duplicate (task, message, owner) sends —
+    common with re-asks and rerun-induced double clicks — skip the agent."""
+    return _agent().get_response(task, msg, owner)
 
 st.set_page_config(page_title="NudgeAI Dashboard", layout="wide")
 st.title("🚀 NudgeAI - Personal Assistant Dashboard")
 
-# Get base directory
-base_dir = os.path.join(os.path.dirname(__file__), '..')
+@st.cache_data(show_spinner=False)
+def _load_tasks(path, mtime):
+    """Parse tasks.json once per file version; the mtime in the cache key
+    invalidates the entry whenever the file changes on disk. cache_data
+    hands each caller a copy, so in-place edits never poison the cache."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
 
-# Load extracted tasks from JSON file
-tasks_file = os.path.join(base_dir, 'data', 'tasks.json')
-if os.path.exists(tasks_file):
-    with open(tasks_file) as f:
-        all_tasks = json.load(f)
+
+if TASKS_FILE.exists():
+    all_tasks = _load_tasks(str(TASKS_FILE), TASKS_FILE.stat().st_mtime)
 else:
     all_tasks = []
 
+# Writes are debounced: save_tasks() marks the in-memory list dirty and a
+# flush writes at most once per interval, coalescing bursts of clicks.
+_FLUSH_INTERVAL = 5.0
+
+
+@st.cache_resource(show_spinner=False)
+def _flush_state():
+    """Process-global flush state: dirty flag, serialized payload, last
+    flush time. Lives in cache_resource rather than st.session_state so
+    the atexit hook — which runs without a script context, where
+    session_state is unavailable — can still see and write the payload."""
+    return {"dirty": False, "payload": b"", "last_flush": 0.0}
+
+
+def save_tasks():
+    """Record the current task list for persistence; flushed when due.
+
+    Serializes once up front and hashes the payload: if nothing actually
+    changed since the last save (e.g. a re-triggered widget callback), the
+    call is a no-op and the file is never touched.
+    """
+    payload = _dumps(all_tasks)
+    h = hashlib.blake2b(payload, digest_size=16).digest()
+    if h == st.session_state.get("_tasks_hash"):
+        return
+    st.session_state["_tasks_hash"] = h
+    st.session_state["_tasks_pending"] = all_tasks
+    st.session_state["_tasks_dirty"] = True
+    state = _flush_state()
+    state["payload"] = payload
+    state["dirty"] = True
+    _flush_tasks()
+
+
+def _flush_tasks(force=False):
+    """Write the pending payload if dirty and the debounce window passed."""
+    state = _flush_state()
+    if not state["dirty"]:
+        return
+    if not force and time.time() - state["last_flush"] < _FLUSH_INTERVAL:
+        return
+    # Atomic swap so a crash mid-write can't truncate tasks.json; the
+    # payload was already serialized (compactly) by save_tasks.
+    tmp = TASKS_FILE.with_suffix(".json.tmp")
+    with open(tmp, "wb", buffering=64 * 1024) as f:
+        f.write(state["payload"])
+    os.replace(tmp, TASKS_FILE)
+    state["dirty"] = False
+    state["last_flush"] = time.time()
+    # Session bookkeeping last: at interpreter shutdown this access can
+    # raise, but the file is already safely on disk by then.
+    st.session_state["_tasks_dirty"] = False
+
+
+def _force_flush():
+    # atexit runs without a script context; never let that break shutdown.
+    try:
+        _flush_tasks(force=True)
+    except Exception:
+        pass
+
+
+if not st.session_state.get("_flush_registered"):
+    st.session_state["_flush_registered"] = True
+    atexit.register(_force_flush)
+
+# Un-flushed mutations from the previous rerun are newer than the file.
+if st.session_state.get("_tasks_dirty"):
+    all_tasks = st.session_state["_tasks_pending"]
+
+# Give every task a stable id and index by it: modal references and action
+# handlers use the id, so they survive re-sorts, filters and external edits
+# that would invalidate a positional index. Dict values are shared
+# references, so mutations through tasks_by_id still land in all_tasks.
+_ids_added = False
+for _task in all_tasks:
+    if not _task.get("id"):
+        _task["id"] = uuid.uuid4().hex
+        _ids_added = True
+tasks_by_id = {t["id"]: t for t in all_tasks}
+if _ids_added:
+    save_tasks()
+
 # Initialize session state for modals
 if "show_email_modal" not in st.session_state:
     st.session_state.show_email_modal = None
 if "show_chat_modal" not in st.session_state:
     st.session_state.show_chat_modal = None
 if "chat_history" not in st.session_state:
-    st.session_state.chat_history = {}  # {task_idx: [messages...]}
-if "chat_input" not in st.session_state:
-    st.session_state.chat_input = ""
+    st.session_state.chat_history = {}  # {task_id: [messages...]}
 
-# MODAL: View Source Email - Display at top if active
-if st.session_state.show_email_modal is not None:
-    task_idx = st.session_state.show_email_modal
-    if task_idx < len(all_tasks):
-        task = all_tasks[task_idx]
+# Drop stale modal references up front (cleared file, task removed
+# externally) so neither fragment even starts its container setup.
+if (_mid := st.session_state.show_email_modal) is not None and _mid not in tasks_by_id:
+    st.session_state.show_email_modal = None
+if (_mid := st.session_state.show_chat_modal) is not None and _mid not in tasks_by_id:
+    st.session_state.show_chat_modal = None
+
+# MODAL: View Source Email - rendered as a fragment so its buttons rerun
+# only the modal, not the whole dashboard
+@st.fragment
+def _email_modal():
+    task_id = st.session_state.show_email_modal
+    task = tasks_by_id.get(task_id)
+    if task is not None:
         email_data = task.get("source_email", {})
-        
+
         with st.container(border=True):
             st.subheader(f"📧 Source Email: {task['task']}")
             col1, col2 = st.columns([4, 1])
@@ -51,7 +189,7 @@ if st.session_state.show_email_modal is not None:
             with col2:
                 if st.button("❌ Close Email", key="close_email_modal"):
                     st.session_state.show_email_modal = None
-                    st.rerun()
+                    st.rerun(scope="fragment")
             
             st.markdown("---")
             st.write("**Email Body:**")
@@ -62,33 +200,46 @@ if st.session_state.show_email_modal is not None:
             reply_text = st.text_area(
                 "Your reply:",
                 placeholder="Type your response here...",
-                key=f"reply_text_modal_{task_idx}",
+                key=f"reply_text_modal_{task_id}",
                 label_visibility="collapsed",
                 height=120
             )
-            
+
             col1, col2 = st.columns(2)
             with col1:
-                if st.button("📤 Send Reply", key=f"send_reply_modal_{task_idx}"):
+                if st.button("📤 Send Reply", key=f"send_reply_modal_{task_id}"):
                     if reply_text:
                         st.success(f"✅ Reply sent to {email_data.get('from', 'sender')}!")
                         st.info(f"Your reply: {reply_text}")
                         st.session_state.show_email_modal = None
-                        st.rerun()
+                        st.rerun(scope="fragment")
                     else:
                         st.warning("Please write a reply before sending!")
             with col2:
-                if st.button("Cancel", key=f"cancel_reply_{task_idx}"):
+                if st.button("Cancel", key=f"cancel_reply_{task_id}"):
                     st.session_state.show_email_modal = None
-                    st.rerun()
+                    st.rerun(scope="fragment")
         st.divider()
 
-# MODAL: Chatbot Task Completion - Display at top if active
-if st.session_state.show_chat_modal is not None:
-    task_idx = st.session_state.show_chat_modal
-    if task_idx < len(all_tasks):
-        task = all_tasks[task_idx]
-        
+
+if st.session_state.show_email_modal is not None:
+    _email_modal()
+
+def _close_chat_modal(task_id):
+    """Hide the chat modal and drop the task's history in one place; every
+    close/cancel/complete branch funnels through here. pop() with a default
+    replaces the old membership-check-then-del pair."""
+    st.session_state.show_chat_modal = None
+    st.session_state.chat_history.pop(task_id, None)
+
+
+# MODAL: Chatbot Task Completion - fragment-scoped for chat interactions;
+# completion still triggers a full rerun since it changes the task list
+@st.fragment
+def _chat_modal():
+    task_id = st.session_state.show_chat_modal
+    task = tasks_by_id.get(task_id)
+    if task is not None:
         with st.container(border=True):
             st.subheader(f"💬 AI Agent Assistant: {task['task']}")
             col1, col2 = st.columns([4, 1])
@@ -97,221 +248,223 @@ if st.session_state.show_chat_modal is not None:
                 st.write(f"**Owner:** {task.get('owner', 'Unassigned')}")
             with col2:
                 if st.button("❌ Close Chat", key="close_chat_modal"):
-                    st.session_state.show_chat_modal = None
-                    # Clear chat history when closing
-                    if task_idx in st.session_state.chat_history:
-                        del st.session_state.chat_history[task_idx]
-                    st.rerun()
-            
+                    _close_chat_modal(task_id)
+                    st.rerun(scope="fragment")
+
             st.markdown("---")
-            
-            # Initialize chat history for this task
-            if task_idx not in st.session_state.chat_history:
-                st.session_state.chat_history[task_idx] = [
+
+            # Initialize chat history for this task. A bounded deque keeps a
+            # sliding window of recent turns, so re-render cost per rerun is
+            # capped no matter how long the conversation runs.
+            if task_id not in st.session_state.chat_history:
+                st.session_state.chat_history[task_id] = deque([
                     {
                         "role": "assistant",
                         "content": f"👋 Hi! I'm your AI assistant. I'm here to help you complete '{task['task']}'. What would you like to do? You can ask for help, tell me about your progress, or ask me to help you complete this task."
                     }
-                ]
+                ], maxlen=40)
             
             # Display conversation history
-            chat_container = st.container()
-            with chat_container:
-                for message in st.session_state.chat_history[task_idx]:
-                    if message["role"] == "user":
-                        st.write(f"👤 **You:** {message['content']}")
-                    else:
-                        st.write(f"🤖 **AI Agent:** {message['content']}")
-            
+            for message in st.session_state.chat_history[task_id]:
+                with st.chat_message(message["role"]):
+                    st.write(message["content"])
+
             st.markdown("---")
-            
-            # Chat input
-            # If a clear flag exists from the previous run, clear the widget value BEFORE instantiation
-            clear_key = f"clear_chat_{task_idx}"
-            widget_key = f"chat_input_modal_{task_idx}"
-            if st.session_state.get(clear_key):
-                # set the widget value to empty and remove the clear flag
-                st.session_state[widget_key] = ""
-                del st.session_state[clear_key]
 
-            col1, col2 = st.columns([4, 1])
-            with col1:
-                user_input = st.text_input(
-                    "Your message:",
-                    placeholder="Ask for help, describe what you've done, or tell me to complete this task...",
-                    key=widget_key,
-                    label_visibility="collapsed"
-                )
-            with col2:
-                send_button = st.button("📤 Send", key=f"send_chat_modal_{task_idx}")
-            
-            if send_button and user_input:
-                # Add user message to history
-                st.session_state.chat_history[task_idx].append({
-                    "role": "user",
-                    "content": user_input
-                })
-                
-                # Get AI response
-                ai_response = get_ai_response(task['task'], user_input, task.get('owner', 'You'))
-                
-                # Add AI response to history
-                st.session_state.chat_history[task_idx].append({
-                    "role": "assistant",
-                    "content": ai_response["response"]
-                })
-                
-                # Handle completion action
+            # chat_input clears itself after submit, so no clear-flag dance
+            # or pre-widget session_state writes are needed.
+            user_input = st.chat_input(
+                "Ask for help, describe what you've done, or tell me to complete this task...",
+                key=f"chat_input_modal_{task_id}",
+            )
+
+            if user_input:
+                history = st.session_state.chat_history[task_id]
+                history.append({"role": "user", "content": user_input})
+
+                # Get AI response (cached for repeated identical sends)
+                ai_response = _cached_ai_response(task['task'], user_input, task.get('owner', 'You'))
+                history.append({"role": "assistant", "content": ai_response["response"]})
+
+                # Single terminal rerun: chat stays fragment-scoped, while
+                # completion widens to the full app since it changes the
+                # task list rendered outside this modal.
+                scope = "fragment"
                 if ai_response["action"] == "complete":
-                    all_tasks[task_idx]["status"] = "completed"
-                    all_tasks[task_idx]["chat_completion"] = user_input
-                    all_tasks[task_idx]["completed_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    task["status"] = "completed"
+                    task["chat_completion"] = user_input
+                    task["completed_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     save_tasks()
                     st.success("✅ Task marked as completed!")
                     st.balloons()
-                    st.session_state.show_chat_modal = None
-                    if task_idx in st.session_state.chat_history:
-                        del st.session_state.chat_history[task_idx]
-                    # set a clear flag so the widget is cleared on the next run (pre-widget assignment)
-                    st.session_state[f"clear_chat_{task_idx}"] = True
-                    st.rerun()
+                    _close_chat_modal(task_id)
+                    scope = "app"
+                st.rerun(scope=scope)
 
-                # set flag to clear input after sending
-                st.session_state[f"clear_chat_{task_idx}"] = True
-                st.rerun()
-            
             col1, col2 = st.columns(2)
             with col1:
-                if st.button("✅ Mark as Complete", key=f"mark_complete_chat_{task_idx}"):
-                    all_tasks[task_idx]["status"] = "completed"
-                    all_tasks[task_idx]["completed_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                if st.button("✅ Mark as Complete", key=f"mark_complete_chat_{task_id}"):
+                    task["status"] = "completed"
+                    task["completed_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     save_tasks()
                     st.success("✅ Task completed!")
                     st.balloons()
-                    st.session_state.show_chat_modal = None
-                    if task_idx in st.session_state.chat_history:
-                        del st.session_state.chat_history[task_idx]
+                    _close_chat_modal(task_id)
                     st.rerun()
-            
+
             with col2:
-                if st.button("❌ Cancel", key=f"cancel_chat_final_{task_idx}"):
-                    st.session_state.show_chat_modal = None
-                    if task_idx in st.session_state.chat_history:
-                        del st.session_state.chat_history[task_idx]
-                    st.rerun()
+                if st.button("❌ Cancel", key=f"cancel_chat_final_{task_id}"):
+                    _close_chat_modal(task_id)
+                    st.rerun(scope="fragment")
         st.divider()
 
-def save_tasks():
-    """Save updated tasks back to JSON file"""
-    with open(tasks_file, "w") as f:
-        json.dump(all_tasks, f, indent=4)
 
-def mark_task_complete(task_index):
+if st.session_state.show_chat_modal is not None:
+    _chat_modal()
+
+def mark_task_complete(task_id):
     """Mark a task as complete"""
-    all_tasks[task_index]["status"] = "completed"
-    all_tasks[task_index]["completed_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    tasks_by_id[task_id]["status"] = "completed"
+    tasks_by_id[task_id]["completed_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     save_tasks()
 
-def set_reminder(task_index, reminder_option):
+# Reminder option → hours, built once and frozen read-only instead of a
+# dict literal rebuilt on every set_reminder call.
+REMINDER_MAP = MappingProxyType({
+    "1 hour before": 1,
+    "1 day before": 24,
+    "2 days before": 48,
+    "1 week before": 168,
+    "On due date": 0,
+})
+
+def set_reminder(task_id, reminder_option):
     """Set a reminder for a task"""
-    reminder_map = {
-        "1 hour before": 1,
-        "1 day before": 24,
-        "2 days before": 48,
-        "1 week before": 168,
-        "On due date": 0,
-    }
-    all_tasks[task_index]["reminder"] = reminder_option
-    all_tasks[task_index]["reminder_hours"] = reminder_map.get(reminder_option, 0)
+    tasks_by_id[task_id]["reminder"] = reminder_option
+    tasks_by_id[task_id]["reminder_hours"] = REMINDER_MAP.get(reminder_option, 0)
     save_tasks()
 
+def _on_reminder_change(task_id):
+    """Selectbox callback: persist the new reminder. Streamlit's implicit
+    rerun after the callback is the only one — no manual st.rerun."""
+    set_reminder(task_id, st.session_state[f"reminder_{task_id}"])
+    st.toast(f"⏰ Reminder set: {st.session_state[f'reminder_{task_id}']}")
+
 # Display tasks by status
 st.subheader("📋 Pending Tasks")
 
-# Filter pending tasks
-pending_tasks = [(i, t) for i, t in enumerate(all_tasks) if t.get("status") == "pending"]
-
-# Sort by priority: high > medium > low
+# Filter and sort pending tasks by priority: high > medium > low.
+# Decorate-sort-undecorate: the key is computed once per task (lowercased,
+# matching how the display code reads priority) instead of per comparison;
+# the unique index keeps the sort from ever comparing the task dicts.
 priority_order = {"high": 0, "medium": 1, "low": 2}
-pending_tasks.sort(key=lambda x: priority_order.get(x[1].get("priority", "low"), 3))
+_keyed = [
+    (priority_order.get((t.get("priority") or "low").lower(), 3), i, t)
+    for i, t in enumerate(all_tasks)
+    if t.get("status") == "pending"
+]
+_keyed.sort()
+pending_tasks = [t for _, _, t in _keyed]
+
+# Priority → (renderer, headline template): one dict lookup per task
+# instead of an if/elif chain in the render loop.
+PRIORITY_RENDER = {
+    "high": (st.error, "🔴 **[HIGH PRIORITY]** {}"),
+    "medium": (st.warning, "🟡 **[MEDIUM]** {}"),
+    "low": (st.info, "🔵 **[LOW]** {}"),
+}
+
+
+@st.cache_data(show_spinner=False)
+def _task_details_md(owner, deadline, source, suggestion):
+    """Static per-task detail block, built once per distinct field set and
+    emitted as a single caption delta instead of four."""
+    return (
+        f"👤 Owner: {owner} &nbsp;·&nbsp; 📅 Due: {deadline} &nbsp;·&nbsp; 📧 Source: {source}  \n"
+        f"💡 {suggestion}"
+    )
+
+
+def _render_one_pending(task):
+    task_id = task["id"]
+    priority = task.get("priority", "medium").lower()
+
+    # Color coding by priority; anything unrecognised renders as low,
+    # matching the old else branch.
+    render, headline = PRIORITY_RENDER.get(priority, PRIORITY_RENDER["low"])
+    render(headline.format(task['task']))
+
+    # Display task details (one cached markdown delta)
+    st.caption(_task_details_md(
+        task.get('owner', 'Unassigned'),
+        task.get('deadline', 'No deadline'),
+        task.get('source', 'unknown'),
+        task.get('suggestion', ''),
+    ))
+
+    # Action buttons
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        # View Source Email button (modal lives outside this fragment)
+        if st.button("📧 View Email", key=f"view_email_{task_id}"):
+            st.session_state.show_email_modal = task_id
+            st.rerun()
+
+    with col2:
+        # Mark as Done button (changes the outer summary too)
+        if st.button("✅ Mark Done", key=f"mark_done_{task_id}"):
+            mark_task_complete(task_id)
+            st.success("✅ Task marked as done!")
+            st.rerun()
+
+    with col3:
+        # Reminder dropdown: on_change fires only on an actual change, so
+        # the last_reminder_* bookkeeping and explicit rerun are gone.
+        st.selectbox(
+            "⏰ Set Reminder",
+            ["1 hour before", "1 day before", "2 days before", "1 week before", "On due date"],
+            key=f"reminder_{task_id}",
+            label_visibility="collapsed",
+            on_change=_on_reminder_change,
+            args=(task_id,),
+        )
+
+    with col4:
+        # Chatbot icon button (modal lives outside this fragment)
+        if st.button("💬 Chat", key=f"chat_{task_id}"):
+            st.session_state.show_chat_modal = task_id
+            st.rerun()
+
+    st.divider()
+
+
+@st.fragment
+def _render_pending(pending_tasks):
+    for task in pending_tasks:
+        _render_one_pending(task)
+
 
 if pending_tasks:
-    for original_idx, task in pending_tasks:
-        priority = task.get("priority", "medium").lower()
-        
-        # Color coding by priority
-        if priority == "high":
-            st.error(f"🔴 **[HIGH PRIORITY]** {task['task']}")
-        elif priority == "medium":
-            st.warning(f"🟡 **[MEDIUM]** {task['task']}")
-        else:
-            st.info(f"🔵 **[LOW]** {task['task']}")
-        
-        # Display task details
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.caption(f"👤 Owner: {task.get('owner', 'Unassigned')}")
-        with col2:
-            st.caption(f"📅 Due: {task.get('deadline', 'No deadline')}")
-        with col3:
-            st.caption(f"📧 Source: {task.get('source', 'unknown')}")
-        
-        st.caption(f"💡 {task.get('suggestion', '')}")
-        
-        # Action buttons
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            # View Source Email button
-            if st.button("📧 View Email", key=f"view_email_{original_idx}"):
-                st.session_state.show_email_modal = original_idx
-                st.rerun()
-        
-        with col2:
-            # Mark as Done button
-            if st.button("✅ Mark Done", key=f"mark_done_{original_idx}"):
-                mark_task_complete(original_idx)
-                st.success("✅ Task marked as done!")
-                st.rerun()
-        
-        with col3:
-            # Reminder dropdown
-            reminder_option = st.selectbox(
-                "⏰ Set Reminder",
-                ["1 hour before", "1 day before", "2 days before", "1 week before", "On due date"],
-                key=f"reminder_{original_idx}",
-                label_visibility="collapsed"
-            )
-            if reminder_option and str(reminder_option) != st.session_state.get(f"last_reminder_{original_idx}"):
-                st.session_state[f"last_reminder_{original_idx}"] = reminder_option
-                set_reminder(original_idx, reminder_option)
-                st.info(f"⏰ Reminder set: {reminder_option}")
-                st.rerun()
-        
-        with col4:
-            # Chatbot icon button
-            if st.button("💬 Chat", key=f"chat_{original_idx}"):
-                st.session_state.show_chat_modal = original_idx
-                st.rerun()
-        
-        st.divider()
+    _render_pending(pending_tasks)
 else:
     st.info("✅ No pending tasks!")
 
-# Display completed tasks
-st.subheader("✅ Completed Tasks")
+# Display completed tasks, collapsed by default: the per-task widgets only
+# hit the frontend when the expander is opened.
 completed_tasks = [t for t in all_tasks if t.get("status") == "completed"]
 
 if completed_tasks:
-    for task in completed_tasks:
-        st.success(f"✅ {task['task']}")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.caption(f"Completed: {task.get('completed_date', 'N/A')}")
-        with col2:
-            if task.get("reminder"):
-                st.caption(f"⏰ Reminder was: {task['reminder']}")
-        st.divider()
+    with st.expander(f"✅ Completed Tasks ({len(completed_tasks)})", expanded=False):
+        for task in completed_tasks:
+            st.success(f"✅ {task['task']}")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.caption(f"Completed: {task.get('completed_date', 'N/A')}")
+            with col2:
+                if task.get("reminder"):
+                    st.caption(f"⏰ Reminder was: {task['reminder']}")
+            st.divider()
 else:
     st.info("No completed tasks yet.")
 
@@ -329,14 +482,18 @@ with col2:
 with col3:
     st.metric("Pending", pending_count)
 
-# Priority breakdown
-high_priority = len([t for t in all_tasks if t.get("priority") == "high"])
-medium_priority = len([t for t in all_tasks if t.get("priority") == "medium"])
-low_priority = len([t for t in all_tasks if t.get("priority") == "low"])
+# Priority breakdown: one pass instead of a list comprehension per level
+priority_counts = Counter(t.get("priority") for t in all_tasks)
+high_priority = priority_counts["high"]
+medium_priority = priority_counts["medium"]
+low_priority = priority_counts["low"]
 
 st.write("**Priority Breakdown:**")
 st.write(f"🔴 High Priority: {high_priority}")
 st.write(f"🟡 Medium Priority: {medium_priority}")
 st.write(f"🔵 Low Priority: {low_priority}")
 
+# Persist any mutations that are due before this run finishes
+_flush_tasks()
+
 # Need to improve this code more